@@ -39,6 +39,9 @@ setup(
         "visualizer": [
             "matplotlib>=2.2",
         ],
+        "speedups": [
+            "orjson>=3.0",
+        ],
     },
     entry_points={
         "console_scripts": [
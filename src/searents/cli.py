@@ -1,15 +1,22 @@
 """Command-line Interface"""
 
 import argparse
+import concurrent.futures
+import datetime
+import functools
+import itertools
 import logging
 import os
+import pickle  # nosec
 import re
 import sqlite3
 import sys
 import time
-from typing import Any, List, Optional
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import dateutil.parser
+import requests
 
 import searents
 from searents.scraper import ScrapeError
@@ -17,36 +24,294 @@ from searents.survey import RentListing, RentSurvey
 from searents.equity import EquityScraper
 
 
+LOG_LEVELS = {
+    "NOTSET": logging.NOTSET,
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "FATAL": logging.CRITICAL,
+    "CRITICAL": logging.CRITICAL,
+}
+
+EQUITY_URL = "http://www.equityapartments.com"
+# (name, path) of each Equity property; scrapes are cached in a directory
+# named after the property with spaces replaced by underscores.
+EQUITY_APARTMENTS: Tuple[Tuple[str, str], ...] = (
+    ("One Henry Adams", "/san-francisco/design-district/one-henry-adams-apartments"),
+    ("Potrero 1010", "/san-francisco/potrero-hill/potrero-1010-apartments"),
+    ("340 Fremont", "/san-francisco/rincon-hill/340-fremont-apartments"),
+    ("855 Brannan", "/san-francisco/soma/855-brannan-apartments"),
+    (
+        "Acton Courtyard",
+        "/san-francisco-bay/berkeley/berkeley-apartments-acton-courtyard",
+    ),
+    ("ARTech", "/san-francisco-bay/berkeley/berkeley-apartments-artech"),
+    ("Berkeleyan", "/san-francisco-bay/berkeley/berkeley-apartments-berkeleyan"),
+    ("Fine Arts", "/san-francisco-bay/berkeley/berkeley-apartments-fine-arts"),
+    ("Gaia", "/san-francisco-bay/berkeley/berkeley-apartments-gaia"),
+    (
+        "Renaissance Villas",
+        "/san-francisco-bay/berkeley/berkeley-apartments-renaissance-villas",
+    ),
+    ("Touriel", "/san-francisco-bay/berkeley/berkeley-apartments-touriel"),
+    ("Northpark", "/san-francisco-bay/burlingame/northpark-apartments"),
+    ("Skyline Terrace", "/san-francisco-bay/burlingame/skyline-terrace-apartments"),
+    ("Woodleaf", "/san-francisco-bay/campbell/woodleaf-apartments"),
+    ("La Terrazza", "/san-francisco-bay/colma/la-terrazza-apartments"),
+    (
+        "City Gate at Cupertino",
+        "/san-francisco-bay/cupertino/city-gate-at-cupertino-apartments",
+    ),
+    ("88 Hillside", "/san-francisco-bay/daly-city/88-hillside-apartments"),
+    (
+        "Geary Courtyard",
+        "/san-francisco-bay/downtown-san-francisco/geary-courtyard-apartments",
+    ),
+    (
+        "Fountains at Emerald Park",
+        "/san-francisco-bay/dublin/fountains-at-emerald-park-apartments",
+    ),
+    (
+        "Artistry Emeryville",
+        "/san-francisco-bay/emeryville/artistry-emeryville-apartments",
+    ),
+    ("Parc on Powell", "/san-francisco-bay/emeryville/parc-on-powell-apartments"),
+    ("Lantern Cove", "/san-francisco-bay/foster-city/lantern-cove-apartments"),
+    (
+        "Schooner Bay Apartment Homes",
+        "/san-francisco-bay/foster-city/schooner-bay-apartment-homes",
+    ),
+    ("Alborada", "/san-francisco-bay/fremont/alborada-apartments"),
+    (
+        "Archstone Fremont Center",
+        "/san-francisco-bay/fremont/archstone-fremont-center-apartments",
+    ),
+    ("The Terraces", "/san-francisco-bay/lower-nob-hill/the-terraces-apartments"),
+    ("Mill Creek", "/san-francisco-bay/milpitas/mill-creek-apartments"),
+    ("Azure", "/san-francisco-bay/mission-bay/azure-apartments"),
+    (
+        "Reserve at Mountain View",
+        "/san-francisco-bay/mountain-view/reserve-at-mountain-view-apartments",
+    ),
+    ("Domain", "/san-francisco-bay/north-san-jose/domain-apartments"),
+    ("Vista 99", "/san-francisco-bay/north-san-jose/vista-99-apartments"),
+    ("Southwood", "/san-francisco-bay/palo-alto/southwood-apartments"),
+    ("Northridge", "/san-francisco-bay/pleasant-hill/northridge-apartments"),
+    ("Wood Creek", "/san-francisco-bay/pleasant-hill/wood-creek-ca-apartments"),
+    ("Park Hacienda", "/san-francisco-bay/pleasanton/park-hacienda-apartments"),
+    ("Avenue Two", "/san-francisco-bay/redwood-city/avenue-two-apartments"),
+    (
+        "Riva Terra Apartments at Redwood Shores",
+        "/san-francisco-bay/redwood-city/riva-terra-apartments-at-redwood-shores",
+    ),
+    ("Verde", "/san-francisco-bay/san-jose/verde-apartments"),
+    ("55 West Fifth", "/san-francisco-bay/san-mateo/55-west-fifth-apartments"),
+    ("Creekside", "/san-francisco-bay/san-mateo/creekside-apartments"),
+    (
+        "Park Place at San Mateo",
+        "/san-francisco-bay/san-mateo/park-place-at-san-mateo-apartments",
+    ),
+    ("Canyon Creek", "/san-francisco-bay/san-ramon/canyon-creek-ca-apartments"),
+    (
+        "Estancia at Santa Clara",
+        "/san-francisco-bay/santa-clara/estancia-at-santa-clara-apartments",
+    ),
+    ("Laguna Clara", "/san-francisco-bay/santa-clara/laguna-clara-apartments"),
+    (
+        "Summit at Sausalito",
+        "/san-francisco-bay/sausalito/summit-at-sausalito-apartments",
+    ),
+    ("77 Bluxome", "/san-francisco-bay/soma/77-bluxome-apartments"),
+    ("SoMa Square", "/san-francisco-bay/soma/soma-square-apartments"),
+    (
+        "South City Station",
+        "/san-francisco-bay/south-san-francisco/south-city-station-apartments",
+    ),
+    ("Arbor Terrace", "/san-francisco-bay/sunnyvale/arbor-terrace-apartments"),
+    ("Briarwood", "/san-francisco-bay/sunnyvale/briarwood-apartments"),
+    ("The Arches", "/san-francisco-bay/sunnyvale/the-arches-apartments"),
+    ("Parkside", "/san-francisco-bay/union-city/parkside-apartments"),
+    ("Skylark", "/san-francisco-bay/union-city/skylark-apartments"),
+    ("Springline", "/seattle/admiral-district/springline-apartments"),
+    ("Odin", "/seattle/ballard/odin-apartments"),
+    ("Urbana", "/seattle/ballard/urbana-apartments"),
+    ("2300 Elliott", "/seattle/belltown/2300-elliott-apartments"),
+    (
+        "Centennial Tower and Court",
+        "/seattle/belltown/centennial-tower-and-court-apartments",
+    ),
+    ("Moda", "/seattle/belltown/moda-apartments"),
+    ("Olympus", "/seattle/belltown/olympus-apartments"),
+    ("Ivorywood", "/seattle/bothell/ivorywood-apartments"),
+    ("Providence", "/seattle/bothell/providence-apartments"),
+    ("Packard Building", "/seattle/capitiol-hill/packard-building-apartments"),
+    ("The Pearl", "/seattle/capitiol-hill/the-pearl-apartments-capitol-hill"),
+    ("Rianna", "/seattle/capitol-hill/rianna-apartments"),
+    (
+        "The Heights on Capitol Hill",
+        "/seattle/capitol-hill/the-heights-on-capitol-hill-apartments",
+    ),
+    ("Three20", "/seattle/capitol-hill/three20-apartments"),
+    (
+        "City Square Bellevue",
+        "/seattle/downtown-bellevue/city-square-bellevue-apartments",
+    ),
+    ("Venn at Main", "/seattle/downtown-bellevue/venn-at-main-apartments"),
+    ("Chelsea Square", "/seattle/downtown-redmond/chelsea-square-apartments"),
+    ("Old Town Lofts", "/seattle/downtown-redmond/old-town-lofts-apartments"),
+    ("Red160", "/seattle/downtown-redmond/red160-apartments"),
+    ("Riverpark", "/seattle/downtown-redmond/riverpark-apartments"),
+    ("Veloce", "/seattle/downtown-redmond/veloce-apartments"),
+    ("Harbor Steps", "/seattle/downtown-seattle/harbor-steps-apartments"),
+    ("Helios", "/seattle/downtown-seattle/helios-apartments"),
+    ("Surrey Downs", "/seattle/factoria/surrey-downs-apartments"),
+    ("Seventh and James", "/seattle/first-hill/seventh-and-james-apartments"),
+    (
+        "Uwajimaya Village",
+        "/seattle/international-district/uwajimaya-village-apartments",
+    ),
+    ("Harrison Square", "/seattle/lower-queen-anne/harrison-square-apartments"),
+    ("Metro on First", "/seattle/lower-queen-anne/metro-on-first-apartments"),
+    ("Heritage Ridge", "/seattle/lynnwood/heritage-ridge-apartments"),
+    ("Monterra in Mill Creek", "/seattle/mill-creek/monterra-in-mill-creek-apartments"),
+    (
+        "The Reserve at Town Center",
+        "/seattle/mill-creek/the-reserve-at-town-center-apartments",
+    ),
+    ("Bellevue Meadows", "/seattle/redmond/bellevue-meadows-apartments"),
+    ("Redmond Court", "/seattle/redmond/redmond-court-apartments"),
+    ("Square One", "/seattle/roosevelt/square-one-apartments"),
+    ("Alcyone", "/seattle/south-lake-union/alcyone-apartments"),
+    ("Cascade", "/seattle/south-lake-union/cascade-apartments"),
+    ("Junction 47", "/seattle/west-seattle/junction-47-apartments"),
+)
+
+
+@functools.lru_cache()
+def _compile(pattern: str) -> Any:
+    return re.compile(pattern)
+
+
+def _regexp(pattern: str, value: Any) -> bool:
+    """Implement SQLite's REGEXP operator, compiling each pattern only once."""
+    return _compile(pattern).search(str(value)) is not None
+
+
+def _timestamp(value: bytes) -> datetime.datetime:
+    """Convert a TIMESTAMP column, which is normally in datetime's own format."""
+    try:
+        return datetime.datetime.fromisoformat(value.decode())
+    except (AttributeError, ValueError):  # Python < 3.7 or an unusual format
+        return dateutil.parser.parse(value)
+
+
 def database_connection(*args: Any, **kwargs: Any) -> sqlite3.Connection:
     """Create a connection to the database."""
     kwargs["detect_types"] = sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
-    sqlite3.register_converter("TIMESTAMP", dateutil.parser.parse)
+    sqlite3.register_converter("TIMESTAMP", _timestamp)
     connection = sqlite3.connect(*args, **kwargs)
     connection.row_factory = sqlite3.Row
+    connection.create_function("REGEXP", 2, _regexp)
     connection.execute(
         "CREATE TABLE IF NOT EXISTS listings"
         "(timestamp TIMESTAMP, url TEXT, scraper TEXT, unit TEXT, price REAL)",
     )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS listings_scraper ON listings(scraper)",
+    )
     connection.commit()
     return connection
 
 
+def insert_listings(
+    connection: sqlite3.Connection,
+    rows: Iterable[Tuple[Any, ...]],
+    batch_size: int = 100,
+) -> None:
+    """Insert rows into the listings table, several rows per statement."""
+    # Only placeholders are interpolated.
+    batch_statement = "INSERT INTO listings VALUES " + ", ".join(  # nosec
+        ["(?, ?, ?, ?, ?)"] * batch_size,
+    )
+    iterator = iter(rows)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if len(batch) < batch_size:
+            break
+        connection.execute(batch_statement, list(itertools.chain.from_iterable(batch)))
+    connection.executemany("INSERT INTO listings VALUES (?, ?, ?, ?, ?)", batch)
+
+
+def listing_rows(scraper_name: str, survey: RentSurvey) -> Iterator[Tuple[Any, ...]]:
+    """Generate rows of the listings table from a survey."""
+    columns = attrgetter("timestamp", "url", "unit", "price")
+    return (
+        (timestamp, url, scraper_name, unit, price)
+        for timestamp, url, unit, price in map(columns, survey.listings)
+    )
+
+
+def load_cache_survey(scraper: EquityScraper) -> RentSurvey:
+    """Generate a RentSurvey from a scrape cache, reusing a saved one if current."""
+    if scraper.cache_path is None:
+        return scraper.cache_survey
+    path = scraper.cache_path + ".survey.pickle"
+    try:
+        # New scrapes update the cache directory's mtime.
+        if os.stat(path).st_mtime_ns > os.stat(scraper.cache_path).st_mtime_ns:
+            with open(path, "rb") as survey_f:
+                version, survey = pickle.load(survey_f)  # nosec
+            if version == searents.__version__ and isinstance(survey, RentSurvey):
+                return survey
+    except FileNotFoundError:
+        pass
+    # Unpickling can raise almost anything, so any failure is a cache miss.
+    except Exception as exc:  # pylint: disable=broad-except
+        logging.warning("%s could not be loaded: %s", path, exc)
+
+    survey = scraper.cache_survey
+    with open(path + ".tmp", "wb") as survey_f:
+        pickle.dump((searents.__version__, survey), survey_f, pickle.HIGHEST_PROTOCOL)
+    os.replace(path + ".tmp", path)
+    return survey
+
+
+def database_matches(
+    connection: sqlite3.Connection,
+    scraper_name: str,
+    survey: RentSurvey,
+) -> bool:
+    """Check whether the database has the same listings as a survey."""
+    ((count,),) = connection.execute(
+        "SELECT COUNT(*) FROM listings WHERE scraper=?",
+        (scraper_name,),
+    )
+    if count != len(survey.listings):
+        return False
+    # Ties are broken by insertion order, like the stable sort of the survey.
+    cursor = connection.execute(
+        "SELECT * FROM listings WHERE scraper=? ORDER BY timestamp, rowid",
+        (scraper_name,),
+    )
+    return all(
+        RentListing(**row) == listing
+        for row, listing in zip(
+            cursor,
+            sorted(survey.listings, key=attrgetter("timestamp")),
+        )
+    )
+
+
 def fetch_handler(
     args: argparse.Namespace,
     scrapers: List[EquityScraper],
     connection: sqlite3.Connection,
 ) -> None:
     """Fetch new listings."""
-    for scraper in scrapers:
-
-        logging.info("Fetching new listings from %s...", scraper.name)
-        try:
-            survey = scraper.scrape_survey()
-        except ScrapeError as exc:
-            logging.warning("New listings could not be fetched: %s", exc.__cause__)
-            print(f"Fetching {scraper.name} failed:", exc.__cause__, file=sys.stderr)
-            continue
 
+    def write(scraper: EquityScraper, survey: RentSurvey) -> None:
         logging.info("%d new listings were fetched.", len(survey.listings))
         if survey.listings:
             print(survey)
@@ -55,19 +320,43 @@ def fetch_handler(
                 "Writing the new listings to the database at %s...",
                 args.database,
             )
-            connection.executemany(
-                "INSERT INTO listings VALUES (?, ?, ?, ?, ?)",
-                [
-                    (
-                        listing.timestamp,
-                        listing.url,
-                        scraper.name,
-                        listing.unit,
-                        listing.price,
+            insert_listings(connection, listing_rows(scraper.name, survey))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = []
+        for scraper in scrapers:
+            logging.info("Fetching new listings from %s...", scraper.name)
+            futures.append(executor.submit(scraper.scrape_survey))
+
+        pending = list(zip(scrapers, futures))
+        try:
+            while pending:
+                scraper, future = pending.pop(0)
+                try:
+                    survey = future.result()
+                except ScrapeError as exc:
+                    logging.warning(
+                        "New listings could not be fetched: %s",
+                        exc.__cause__,
                     )
-                    for listing in survey.listings
-                ],
-            )
+                    print(
+                        f"Fetching {scraper.name} failed:",
+                        exc.__cause__,
+                        file=sys.stderr,
+                    )
+                    continue
+                write(scraper, survey)
+        except BaseException:
+            # Stop queued scrapes, but keep the listings of any that already
+            # updated the cache so the cache and database don't diverge.
+            for _, future in pending:
+                future.cancel()
+            for scraper, future in pending:
+                if not future.cancelled() and future.exception() is None:
+                    write(scraper, future.result())
+            raise
+        finally:
+            # Keep what was fetched even if a later scraper fails.
             connection.commit()
 
 
@@ -82,27 +371,33 @@ def regenerate_handler(
     if os.path.exists(args.database):
         os.rename(args.database, args.database + "." + str(time.time()))
     connection = database_connection(args.database)
+    # Durability can be relaxed since the database can always be regenerated.
+    connection.execute("PRAGMA synchronous=OFF")
+    # Build the index once after loading rather than maintaining it per row.
+    connection.execute("DROP INDEX listings_scraper")
 
-    for scraper in scrapers:
+    def rows(scraper: EquityScraper, survey: RentSurvey) -> Iterator[Tuple[Any, ...]]:
+        logging.info("Writing the %s survey to the database...", scraper.name)
+        yield from listing_rows(scraper.name, survey)
 
-        logging.info("Generating a survey from the cache at %s...", scraper.cache_path)
-        survey = scraper.cache_survey
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        cache_surveys = []
+        for scraper in scrapers:
+            logging.info(
+                "Generating a survey from the cache at %s...",
+                scraper.cache_path,
+            )
+            cache_surveys.append(executor.submit(load_cache_survey, scraper))
 
-        logging.info("Writing the %s survey to the database...", scraper.name)
-        connection.executemany(
-            "INSERT INTO listings VALUES (?, ?, ?, ?, ?)",
-            [
-                (
-                    listing.timestamp,
-                    listing.url,
-                    scraper.name,
-                    listing.unit,
-                    listing.price,
-                )
-                for listing in survey.listings
-            ],
+        insert_listings(
+            connection,
+            itertools.chain.from_iterable(
+                rows(scraper, cache_survey.result())
+                for scraper, cache_survey in zip(scrapers, cache_surveys)
+            ),
         )
-        connection.commit()
+    connection.execute("CREATE INDEX listings_scraper ON listings(scraper)")
+    connection.commit()
 
     connection.close()
     sys.exit()
@@ -114,28 +409,33 @@ def show_handler(
     connection: sqlite3.Connection,
 ) -> None:
     """Show listings."""
-    survey = RentSurvey()
-    for scraper in scrapers:
-        logging.info(
-            "Reading %s listings from the database at %s...",
-            scraper.name,
-            args.database,
-        )
-        cursor = connection.cursor()
-        cursor.execute("SELECT * FROM listings WHERE scraper=?", (scraper.name,))
-        survey.listings.extend(
-            RentListing(**listing)
-            for listing in (dict(row) for row in cursor.fetchall())
-            if any(
-                all(
-                    [
-                        re.search(args.filter_key, str(key)) is not None,
-                        re.search(args.filter, str(value)) is not None,
-                    ],
-                )
-                for key, value in listing.items()
-            )
-        )
+    keys = [
+        column["name"]
+        for column in connection.execute("PRAGMA table_info(listings)")
+        if re.search(args.filter_key, column["name"]) is not None
+    ]
+    if args.filter == ".*":
+        # Every value matches, so a listing only needs a matching key.
+        conditions = ["1"] if keys else []
+    else:
+        conditions = [f"{key} REGEXP :filter" for key in keys]
+    parameters = {
+        f"scraper{index}": scraper.name for index, scraper in enumerate(scrapers)
+    }
+    placeholders = ", ".join(f":{name}" for name in parameters)
+    condition = " OR ".join(conditions) or "0"
+    parameters["filter"] = args.filter
+    # Only parameter names and column names read from the schema are interpolated.
+    query = (
+        f"SELECT * FROM listings WHERE scraper IN ({placeholders})"  # nosec
+        f" AND ({condition})"
+    )
+    logging.info("Reading listings from the database at %s...", args.database)
+    # Listings are shown grouped by scraper, in the order the scrapers were given.
+    listings: Dict[str, List[RentListing]] = {scraper.name: [] for scraper in scrapers}
+    for row in connection.execute(query, parameters):
+        listings[row["scraper"]].append(RentListing(**row))
+    survey = RentSurvey(listings=list(itertools.chain.from_iterable(listings.values())))
     if survey.listings:
         logging.info("Showing %s listings...", len(survey.listings))
         if args.graphical:
@@ -150,25 +450,26 @@ def verify_handler(
     connection: sqlite3.Connection,
 ) -> int:
     """Verify the database against the scrape cache."""
-    for scraper in scrapers:
-
-        logging.info(
-            "Reading %s listings from the database at %s...",
-            scraper.name,
-            args.database,
-        )
-        cursor = connection.execute(
-            "SELECT * FROM listings WHERE scraper=?",
-            (scraper.name,),
-        )
-        survey = RentSurvey(listings=[RentListing(**row) for row in cursor.fetchall()])
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        cache_surveys = []
+        for scraper in scrapers:
+            logging.info(
+                "Generating a survey from the cache at %s...",
+                scraper.cache_path,
+            )
+            cache_surveys.append(executor.submit(load_cache_survey, scraper))
 
-        logging.info("Generating a survey from the cache at %s...", scraper.cache_path)
-        cache_survey = scraper.cache_survey
+        for scraper, cache_survey in zip(scrapers, cache_surveys):
 
-        logging.info("Verifying the %s survey...", scraper.name)
-        if survey != cache_survey:
-            return 1
+            logging.info(
+                "Verifying the %s survey against the database at %s...",
+                scraper.name,
+                args.database,
+            )
+            if not database_matches(connection, scraper.name, cache_survey.result()):
+                for future in cache_surveys:
+                    future.cancel()
+                return 1
 
     return 0
 
@@ -183,8 +484,8 @@ def cli(parser: Optional[argparse.ArgumentParser] = None) -> argparse.ArgumentPa
     parser.add_argument(
         "--cache",
         "-c",
-        help="Specify the directory to store scrape caches in.",
-        default=os.path.join("{directory}", "cache"),
+        default=argparse.SUPPRESS,
+        help="Specify a scrape cache directory. (default: DIRECTORY/cache)",
     )
     parser.add_argument(
         "--directory",
@@ -193,13 +494,13 @@ def cli(parser: Optional[argparse.ArgumentParser] = None) -> argparse.ArgumentPa
     )
     parser.add_argument(
         "--database",
-        help="Specify a SeaRents database.",
-        default=os.path.join("{directory}", "searents.db"),
+        default=argparse.SUPPRESS,
+        help="Specify a SeaRents database. (default: DIRECTORY/searents.db)",
     )
     parser.add_argument(
         "--log-file",
-        help="Specify the file to log to.",
-        default=os.path.join("{directory}", "searents.log"),
+        default=argparse.SUPPRESS,
+        help="Specify the file to log to. (default: DIRECTORY/searents.log)",
     )
     parser.add_argument(
         "--log-level",
@@ -219,6 +520,13 @@ def cli(parser: Optional[argparse.ArgumentParser] = None) -> argparse.ArgumentPa
         "fetch",
         help=fetch_handler.__doc__,
     )
+    fetch_parser.add_argument(
+        "--jobs",
+        "-j",
+        help="Specify how many scrapers to fetch from concurrently.",
+        type=int,
+        default=8,
+    )
     fetch_parser.set_defaults(func=fetch_handler)
 
     regenerate_parser = subparsers.add_parser(
@@ -267,13 +575,17 @@ def main(args: Optional[argparse.Namespace] = None) -> int:
         args = cli().parse_args()
 
     os.makedirs(args.directory, exist_ok=True)
-    args.cache = args.cache.format(directory=args.directory)
-    args.database = args.database.format(directory=args.directory)
-    args.log_file = args.log_file.format(directory=args.directory)
-
-    log_level = getattr(logging, args.log_level.upper(), None)
-    if not isinstance(log_level, int):
-        raise ValueError("Invalid log level: %s" % args.log_level)
+    if getattr(args, "cache", None) is None:
+        args.cache = os.path.join(args.directory, "cache")
+    if getattr(args, "database", None) is None:
+        args.database = os.path.join(args.directory, "searents.db")
+    if getattr(args, "log_file", None) is None:
+        args.log_file = os.path.join(args.directory, "searents.log")
+
+    try:
+        log_level = LOG_LEVELS[args.log_level.upper()]
+    except KeyError as exc:
+        raise ValueError("Invalid log level: %s" % args.log_level) from exc
     logging.basicConfig(
         filename=args.log_file,
         level=log_level,
@@ -281,497 +593,35 @@ def main(args: Optional[argparse.Namespace] = None) -> int:
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    equity_url = "http://www.equityapartments.com"
-    # pylint: disable=line-too-long
-    scrapers = [
-        EquityScraper(
-            name="One Henry Adams",
-            url=equity_url
-            + "/san-francisco/design-district/one-henry-adams-apartments",
-            cache_path=os.path.join(args.cache, "One_Henry_Adams"),
-        ),
-        EquityScraper(
-            name="Potrero 1010",
-            url=equity_url + "/san-francisco/potrero-hill/potrero-1010-apartments",
-            cache_path=os.path.join(args.cache, "Potrero_1010"),
-        ),
-        EquityScraper(
-            name="340 Fremont",
-            url=equity_url + "/san-francisco/rincon-hill/340-fremont-apartments",
-            cache_path=os.path.join(args.cache, "340_Fremont"),
-        ),
-        EquityScraper(
-            name="855 Brannan",
-            url=equity_url + "/san-francisco/soma/855-brannan-apartments",
-            cache_path=os.path.join(args.cache, "855_Brannan"),
-        ),
-        EquityScraper(
-            name="Acton Courtyard",
-            url=equity_url
-            + "/san-francisco-bay/berkeley/berkeley-apartments-acton-courtyard",
-            cache_path=os.path.join(args.cache, "Acton_Courtyard"),
-        ),
-        EquityScraper(
-            name="ARTech",
-            url=equity_url + "/san-francisco-bay/berkeley/berkeley-apartments-artech",
-            cache_path=os.path.join(args.cache, "ARTech"),
-        ),
-        EquityScraper(
-            name="Berkeleyan",
-            url=equity_url
-            + "/san-francisco-bay/berkeley/berkeley-apartments-berkeleyan",
-            cache_path=os.path.join(args.cache, "Berkeleyan"),
-        ),
-        EquityScraper(
-            name="Fine Arts",
-            url=equity_url
-            + "/san-francisco-bay/berkeley/berkeley-apartments-fine-arts",
-            cache_path=os.path.join(args.cache, "Fine_Arts"),
-        ),
-        EquityScraper(
-            name="Gaia",
-            url=equity_url + "/san-francisco-bay/berkeley/berkeley-apartments-gaia",
-            cache_path=os.path.join(args.cache, "Gaia"),
-        ),
-        EquityScraper(
-            name="Renaissance Villas",
-            url=equity_url
-            + "/san-francisco-bay/berkeley/berkeley-apartments-renaissance-villas",
-            cache_path=os.path.join(args.cache, "Renaissance_Villas"),
-        ),
-        EquityScraper(
-            name="Touriel",
-            url=equity_url + "/san-francisco-bay/berkeley/berkeley-apartments-touriel",
-            cache_path=os.path.join(args.cache, "Touriel"),
-        ),
-        EquityScraper(
-            name="Northpark",
-            url=equity_url + "/san-francisco-bay/burlingame/northpark-apartments",
-            cache_path=os.path.join(args.cache, "Northpark"),
-        ),
-        EquityScraper(
-            name="Skyline Terrace",
-            url=equity_url + "/san-francisco-bay/burlingame/skyline-terrace-apartments",
-            cache_path=os.path.join(args.cache, "Skyline_Terrace"),
-        ),
-        EquityScraper(
-            name="Woodleaf",
-            url=equity_url + "/san-francisco-bay/campbell/woodleaf-apartments",
-            cache_path=os.path.join(args.cache, "Woodleaf"),
-        ),
-        EquityScraper(
-            name="La Terrazza",
-            url=equity_url + "/san-francisco-bay/colma/la-terrazza-apartments",
-            cache_path=os.path.join(args.cache, "La_Terrazza"),
-        ),
-        EquityScraper(
-            name="City Gate at Cupertino",
-            url=equity_url
-            + "/san-francisco-bay/cupertino/city-gate-at-cupertino-apartments",
-            cache_path=os.path.join(args.cache, "City_Gate_at_Cupertino"),
-        ),
-        EquityScraper(
-            name="88 Hillside",
-            url=equity_url + "/san-francisco-bay/daly-city/88-hillside-apartments",
-            cache_path=os.path.join(args.cache, "88_Hillside"),
-        ),
-        EquityScraper(
-            name="Geary Courtyard",
-            url=equity_url
-            + "/san-francisco-bay/downtown-san-francisco/geary-courtyard-apartments",
-            cache_path=os.path.join(args.cache, "Geary_Courtyard"),
-        ),
-        EquityScraper(
-            name="Fountains at Emerald Park",
-            url=equity_url
-            + "/san-francisco-bay/dublin/fountains-at-emerald-park-apartments",
-            cache_path=os.path.join(args.cache, "Fountains_at_Emerald_Park"),
-        ),
-        EquityScraper(
-            name="Artistry Emeryville",
-            url=equity_url
-            + "/san-francisco-bay/emeryville/artistry-emeryville-apartments",
-            cache_path=os.path.join(args.cache, "Artistry_Emeryville"),
-        ),
-        EquityScraper(
-            name="Parc on Powell",
-            url=equity_url + "/san-francisco-bay/emeryville/parc-on-powell-apartments",
-            cache_path=os.path.join(args.cache, "Parc_on_Powell"),
-        ),
-        EquityScraper(
-            name="Lantern Cove",
-            url=equity_url + "/san-francisco-bay/foster-city/lantern-cove-apartments",
-            cache_path=os.path.join(args.cache, "Lantern_Cove"),
-        ),
-        EquityScraper(
-            name="Schooner Bay Apartment Homes",
-            url=equity_url
-            + "/san-francisco-bay/foster-city/schooner-bay-apartment-homes",
-            cache_path=os.path.join(args.cache, "Schooner_Bay_Apartment_Homes"),
-        ),
-        EquityScraper(
-            name="Alborada",
-            url=equity_url + "/san-francisco-bay/fremont/alborada-apartments",
-            cache_path=os.path.join(args.cache, "Alborada"),
-        ),
-        EquityScraper(
-            name="Archstone Fremont Center",
-            url=equity_url
-            + "/san-francisco-bay/fremont/archstone-fremont-center-apartments",
-            cache_path=os.path.join(args.cache, "Archstone_Fremont_Center"),
-        ),
-        EquityScraper(
-            name="The Terraces",
-            url=equity_url
-            + "/san-francisco-bay/lower-nob-hill/the-terraces-apartments",
-            cache_path=os.path.join(args.cache, "The_Terraces"),
-        ),
-        EquityScraper(
-            name="Mill Creek",
-            url=equity_url + "/san-francisco-bay/milpitas/mill-creek-apartments",
-            cache_path=os.path.join(args.cache, "Mill_Creek"),
-        ),
-        EquityScraper(
-            name="Azure",
-            url=equity_url + "/san-francisco-bay/mission-bay/azure-apartments",
-            cache_path=os.path.join(args.cache, "Azure"),
-        ),
-        EquityScraper(
-            name="Reserve at Mountain View",
-            url=equity_url
-            + "/san-francisco-bay/mountain-view/reserve-at-mountain-view-apartments",
-            cache_path=os.path.join(args.cache, "Reserve_at_Mountain_View"),
-        ),
-        EquityScraper(
-            name="Domain",
-            url=equity_url + "/san-francisco-bay/north-san-jose/domain-apartments",
-            cache_path=os.path.join(args.cache, "Domain"),
-        ),
-        EquityScraper(
-            name="Vista 99",
-            url=equity_url + "/san-francisco-bay/north-san-jose/vista-99-apartments",
-            cache_path=os.path.join(args.cache, "Vista_99"),
-        ),
-        EquityScraper(
-            name="Southwood",
-            url=equity_url + "/san-francisco-bay/palo-alto/southwood-apartments",
-            cache_path=os.path.join(args.cache, "Southwood"),
-        ),
-        EquityScraper(
-            name="Northridge",
-            url=equity_url + "/san-francisco-bay/pleasant-hill/northridge-apartments",
-            cache_path=os.path.join(args.cache, "Northridge"),
-        ),
-        EquityScraper(
-            name="Wood Creek",
-            url=equity_url
-            + "/san-francisco-bay/pleasant-hill/wood-creek-ca-apartments",
-            cache_path=os.path.join(args.cache, "Wood_Creek"),
-        ),
-        EquityScraper(
-            name="Park Hacienda",
-            url=equity_url + "/san-francisco-bay/pleasanton/park-hacienda-apartments",
-            cache_path=os.path.join(args.cache, "Park_Hacienda"),
-        ),
-        EquityScraper(
-            name="Avenue Two",
-            url=equity_url + "/san-francisco-bay/redwood-city/avenue-two-apartments",
-            cache_path=os.path.join(args.cache, "Avenue_Two"),
-        ),
-        EquityScraper(
-            name="Riva Terra Apartments at Redwood Shores",
-            url=equity_url
-            + "/san-francisco-bay/redwood-city/riva-terra-apartments-at-redwood-shores",
-            cache_path=os.path.join(
-                args.cache,
-                "Riva_Terra_Apartments_at_Redwood_Shores",
-            ),
-        ),
-        EquityScraper(
-            name="Verde",
-            url=equity_url + "/san-francisco-bay/san-jose/verde-apartments",
-            cache_path=os.path.join(args.cache, "Verde"),
-        ),
-        EquityScraper(
-            name="55 West Fifth",
-            url=equity_url + "/san-francisco-bay/san-mateo/55-west-fifth-apartments",
-            cache_path=os.path.join(args.cache, "55_West_Fifth"),
-        ),
-        EquityScraper(
-            name="Creekside",
-            url=equity_url + "/san-francisco-bay/san-mateo/creekside-apartments",
-            cache_path=os.path.join(args.cache, "Creekside"),
-        ),
-        EquityScraper(
-            name="Park Place at San Mateo",
-            url=equity_url
-            + "/san-francisco-bay/san-mateo/park-place-at-san-mateo-apartments",
-            cache_path=os.path.join(args.cache, "Park_Place_at_San_Mateo"),
-        ),
-        EquityScraper(
-            name="Canyon Creek",
-            url=equity_url + "/san-francisco-bay/san-ramon/canyon-creek-ca-apartments",
-            cache_path=os.path.join(args.cache, "Canyon_Creek"),
-        ),
-        EquityScraper(
-            name="Estancia at Santa Clara",
-            url=equity_url
-            + "/san-francisco-bay/santa-clara/estancia-at-santa-clara-apartments",
-            cache_path=os.path.join(args.cache, "Estancia_at_Santa_Clara"),
-        ),
-        EquityScraper(
-            name="Laguna Clara",
-            url=equity_url + "/san-francisco-bay/santa-clara/laguna-clara-apartments",
-            cache_path=os.path.join(args.cache, "Laguna_Clara"),
-        ),
-        EquityScraper(
-            name="Summit at Sausalito",
-            url=equity_url
-            + "/san-francisco-bay/sausalito/summit-at-sausalito-apartments",
-            cache_path=os.path.join(args.cache, "Summit_at_Sausalito"),
-        ),
-        EquityScraper(
-            name="77 Bluxome",
-            url=equity_url + "/san-francisco-bay/soma/77-bluxome-apartments",
-            cache_path=os.path.join(args.cache, "77_Bluxome"),
-        ),
-        EquityScraper(
-            name="SoMa Square",
-            url=equity_url + "/san-francisco-bay/soma/soma-square-apartments",
-            cache_path=os.path.join(args.cache, "SoMa_Square"),
-        ),
-        EquityScraper(
-            name="South City Station",
-            url=equity_url
-            + "/san-francisco-bay/south-san-francisco/south-city-station-apartments",
-            cache_path=os.path.join(args.cache, "South_City_Station"),
-        ),
-        EquityScraper(
-            name="Arbor Terrace",
-            url=equity_url + "/san-francisco-bay/sunnyvale/arbor-terrace-apartments",
-            cache_path=os.path.join(args.cache, "Arbor_Terrace"),
-        ),
-        EquityScraper(
-            name="Briarwood",
-            url=equity_url + "/san-francisco-bay/sunnyvale/briarwood-apartments",
-            cache_path=os.path.join(args.cache, "Briarwood"),
-        ),
-        EquityScraper(
-            name="The Arches",
-            url=equity_url + "/san-francisco-bay/sunnyvale/the-arches-apartments",
-            cache_path=os.path.join(args.cache, "The_Arches"),
-        ),
-        EquityScraper(
-            name="Parkside",
-            url=equity_url + "/san-francisco-bay/union-city/parkside-apartments",
-            cache_path=os.path.join(args.cache, "Parkside"),
-        ),
-        EquityScraper(
-            name="Skylark",
-            url=equity_url + "/san-francisco-bay/union-city/skylark-apartments",
-            cache_path=os.path.join(args.cache, "Skylark"),
-        ),
-        EquityScraper(
-            name="Springline",
-            url=equity_url + "/seattle/admiral-district/springline-apartments",
-            cache_path=os.path.join(args.cache, "Springline"),
-        ),
-        EquityScraper(
-            name="Odin",
-            url=equity_url + "/seattle/ballard/odin-apartments",
-            cache_path=os.path.join(args.cache, "Odin"),
-        ),
-        EquityScraper(
-            name="Urbana",
-            url=equity_url + "/seattle/ballard/urbana-apartments",
-            cache_path=os.path.join(args.cache, "Urbana"),
-        ),
-        EquityScraper(
-            name="2300 Elliott",
-            url=equity_url + "/seattle/belltown/2300-elliott-apartments",
-            cache_path=os.path.join(args.cache, "2300_Elliott"),
-        ),
-        EquityScraper(
-            name="Centennial Tower and Court",
-            url=equity_url + "/seattle/belltown/centennial-tower-and-court-apartments",
-            cache_path=os.path.join(args.cache, "Centennial_Tower_and_Court"),
-        ),
-        EquityScraper(
-            name="Moda",
-            url=equity_url + "/seattle/belltown/moda-apartments",
-            cache_path=os.path.join(args.cache, "Moda"),
-        ),
-        EquityScraper(
-            name="Olympus",
-            url=equity_url + "/seattle/belltown/olympus-apartments",
-            cache_path=os.path.join(args.cache, "Olympus"),
-        ),
-        EquityScraper(
-            name="Ivorywood",
-            url=equity_url + "/seattle/bothell/ivorywood-apartments",
-            cache_path=os.path.join(args.cache, "Ivorywood"),
-        ),
-        EquityScraper(
-            name="Providence",
-            url=equity_url + "/seattle/bothell/providence-apartments",
-            cache_path=os.path.join(args.cache, "Providence"),
-        ),
-        EquityScraper(
-            name="Packard Building",
-            url=equity_url + "/seattle/capitiol-hill/packard-building-apartments",
-            cache_path=os.path.join(args.cache, "Packard_Building"),
-        ),
-        EquityScraper(
-            name="The Pearl",
-            url=equity_url + "/seattle/capitiol-hill/the-pearl-apartments-capitol-hill",
-            cache_path=os.path.join(args.cache, "The_Pearl"),
-        ),
-        EquityScraper(
-            name="Rianna",
-            url=equity_url + "/seattle/capitol-hill/rianna-apartments",
-            cache_path=os.path.join(args.cache, "Rianna"),
-        ),
-        EquityScraper(
-            name="The Heights on Capitol Hill",
-            url=equity_url
-            + "/seattle/capitol-hill/the-heights-on-capitol-hill-apartments",
-            cache_path=os.path.join(args.cache, "The_Heights_on_Capitol_Hill"),
-        ),
-        EquityScraper(
-            name="Three20",
-            url=equity_url + "/seattle/capitol-hill/three20-apartments",
-            cache_path=os.path.join(args.cache, "Three20"),
-        ),
-        EquityScraper(
-            name="City Square Bellevue",
-            url=equity_url
-            + "/seattle/downtown-bellevue/city-square-bellevue-apartments",
-            cache_path=os.path.join(args.cache, "City_Square_Bellevue"),
-        ),
-        EquityScraper(
-            name="Venn at Main",
-            url=equity_url + "/seattle/downtown-bellevue/venn-at-main-apartments",
-            cache_path=os.path.join(args.cache, "Venn_at_Main"),
-        ),
-        EquityScraper(
-            name="Chelsea Square",
-            url=equity_url + "/seattle/downtown-redmond/chelsea-square-apartments",
-            cache_path=os.path.join(args.cache, "Chelsea_Square"),
-        ),
-        EquityScraper(
-            name="Old Town Lofts",
-            url=equity_url + "/seattle/downtown-redmond/old-town-lofts-apartments",
-            cache_path=os.path.join(args.cache, "Old_Town_Lofts"),
-        ),
-        EquityScraper(
-            name="Red160",
-            url=equity_url + "/seattle/downtown-redmond/red160-apartments",
-            cache_path=os.path.join(args.cache, "Red160"),
-        ),
-        EquityScraper(
-            name="Riverpark",
-            url=equity_url + "/seattle/downtown-redmond/riverpark-apartments",
-            cache_path=os.path.join(args.cache, "Riverpark"),
-        ),
-        EquityScraper(
-            name="Veloce",
-            url=equity_url + "/seattle/downtown-redmond/veloce-apartments",
-            cache_path=os.path.join(args.cache, "Veloce"),
-        ),
-        EquityScraper(
-            name="Harbor Steps",
-            url=equity_url + "/seattle/downtown-seattle/harbor-steps-apartments",
-            cache_path=os.path.join(args.cache, "Harbor_Steps"),
-        ),
-        EquityScraper(
-            name="Helios",
-            url=equity_url + "/seattle/downtown-seattle/helios-apartments",
-            cache_path=os.path.join(args.cache, "Helios"),
-        ),
-        EquityScraper(
-            name="Surrey Downs",
-            url=equity_url + "/seattle/factoria/surrey-downs-apartments",
-            cache_path=os.path.join(args.cache, "Surrey_Downs"),
-        ),
-        EquityScraper(
-            name="Seventh and James",
-            url=equity_url + "/seattle/first-hill/seventh-and-james-apartments",
-            cache_path=os.path.join(args.cache, "Seventh_and_James"),
-        ),
-        EquityScraper(
-            name="Uwajimaya Village",
-            url=equity_url
-            + "/seattle/international-district/uwajimaya-village-apartments",
-            cache_path=os.path.join(args.cache, "Uwajimaya_Village"),
-        ),
-        EquityScraper(
-            name="Harrison Square",
-            url=equity_url + "/seattle/lower-queen-anne/harrison-square-apartments",
-            cache_path=os.path.join(args.cache, "Harrison_Square"),
-        ),
-        EquityScraper(
-            name="Metro on First",
-            url=equity_url + "/seattle/lower-queen-anne/metro-on-first-apartments",
-            cache_path=os.path.join(args.cache, "Metro_on_First"),
-        ),
-        EquityScraper(
-            name="Heritage Ridge",
-            url=equity_url + "/seattle/lynnwood/heritage-ridge-apartments",
-            cache_path=os.path.join(args.cache, "Heritage_Ridge"),
-        ),
-        EquityScraper(
-            name="Monterra in Mill Creek",
-            url=equity_url + "/seattle/mill-creek/monterra-in-mill-creek-apartments",
-            cache_path=os.path.join(args.cache, "Monterra_in_Mill_Creek"),
-        ),
-        EquityScraper(
-            name="The Reserve at Town Center",
-            url=equity_url
-            + "/seattle/mill-creek/the-reserve-at-town-center-apartments",
-            cache_path=os.path.join(args.cache, "The_Reserve_at_Town_Center"),
-        ),
-        EquityScraper(
-            name="Bellevue Meadows",
-            url=equity_url + "/seattle/redmond/bellevue-meadows-apartments",
-            cache_path=os.path.join(args.cache, "Bellevue_Meadows"),
-        ),
-        EquityScraper(
-            name="Redmond Court",
-            url=equity_url + "/seattle/redmond/redmond-court-apartments",
-            cache_path=os.path.join(args.cache, "Redmond_Court"),
-        ),
-        EquityScraper(
-            name="Square One",
-            url=equity_url + "/seattle/roosevelt/square-one-apartments",
-            cache_path=os.path.join(args.cache, "Square_One"),
-        ),
-        EquityScraper(
-            name="Alcyone",
-            url=equity_url + "/seattle/south-lake-union/alcyone-apartments",
-            cache_path=os.path.join(args.cache, "Alcyone"),
-        ),
-        EquityScraper(
-            name="Cascade",
-            url=equity_url + "/seattle/south-lake-union/cascade-apartments",
-            cache_path=os.path.join(args.cache, "Cascade"),
-        ),
-        EquityScraper(
-            name="Junction 47",
-            url=equity_url + "/seattle/west-seattle/junction-47-apartments",
-            cache_path=os.path.join(args.cache, "Junction_47"),
-        ),
-    ]
-    # pylint: enable=line-too-long
+    if args.scraper == ".*":
+        apartments = EQUITY_APARTMENTS
+    else:
+        pattern = re.compile(args.scraper)
+        apartments = tuple(
+            (name, path)
+            for name, path in EQUITY_APARTMENTS
+            if pattern.search(name) is not None
+        )
+    # All of the scrapers fetch from the same host, so share its connections.
+    session = requests.Session()
+    if args.func is show_handler:
+        # Showing only reads the database, so skip setting up cache directories.
+        scrapers = [
+            EquityScraper(name=name, url=EQUITY_URL + path, session=session)
+            for name, path in apartments
+        ]
+    else:
+        scrapers = [
+            EquityScraper(
+                name=name,
+                url=EQUITY_URL + path,
+                session=session,
+                cache_path=os.path.join(args.cache, name.replace(" ", "_")),
+            )
+            for name, path in apartments
+        ]
 
     connection = database_connection(args.database)
-    status = args.func(
-        args,
-        [
-            scraper
-            for scraper in scrapers
-            if re.search(args.scraper, scraper.name) is not None
-        ],
-        connection,
-    )
+    status = args.func(args, scrapers, connection)
     connection.close()
     return int(status or 0)
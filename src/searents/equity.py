@@ -1,64 +1,119 @@
 """Library for Scraping Equity Apartments"""
 
-from html.parser import HTMLParser
+import html
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import re
+from typing import Any, Dict, List, Match, Optional, cast
 
 from searents.scraper import BaseScraper, Scrape
 from searents.survey import RentListing, RentSurvey
 
+# Currency symbols and thousands separators are removed from prices.
+_PRICE_DELETIONS = str.maketrans("", "", "$,")
 
-class EquityParser(HTMLParser):
-    """Parse HTML from an Equity website."""
+# Script and style elements, whose content is text rather than markup
+# The end tag is optional so that an unterminated element is matched to the end
+# of the data rather than backtracked through.
+_RAWTEXT = (
+    r"(?i:script\b[^<]*(?:<(?!/script)[^<]*)*(?:</script\s*>)?"
+    r"|style\b[^<]*(?:<(?!/style)[^<]*)*(?:</style\s*>)?)"
+)
 
-    units: List[Dict[str, str]] = []
-    _unit: Optional[Dict[str, str]] = None
 
-    def handle_startendtag(
-        self,
-        tag: str,
-        attrs: List[Tuple[str, Optional[str]]],
-    ) -> None:
-        """Parse the floorplan and description."""
-        if self._unit is not None:
-            for attr in attrs:
-                if attr[0] == "src":
-                    self._unit["floorplan"] = attr[1] or ""
-                if attr[0] == "alt":
-                    self._unit["description"] = attr[1] or ""
-
-    def handle_endtag(self, tag: str) -> None:
-        """Detect the end of the listing."""
-        if tag == "li" and self._unit is not None:
-            self.units.append(self._unit)
-            self._unit = None
-
-    def handle_data(self, data: str) -> None:
-        """Parse the price."""
-        data = data.strip()
-        if data and self._unit is not None:
-            if self.get_starttag_text() == '<span class="pricing">':
-                self._unit["price"] = data
-
-    def handle_comment(self, data: str) -> None:
-        """Detect the start of a listing."""
-        data = data.strip()
-        if data.startswith("ledgerId"):
-            ledger, building, unit = data.split(", ")
-            self._unit = {
-                "ledger": ledger.split(" ")[1],
-                "building": building.split(" ")[1],
-                "unit": unit.split(" ")[1],
-            }
-
-    def error(self, message: str) -> None:
-        """Suppress errors."""
+class EquityParser:
+    """Parse HTML from an Equity website."""
+
+    # Only the markup describing units is matched; everything else is skipped.
+    # Script and style content is matched as a whole so that markup in it
+    # (e.g. a </li> in a JavaScript template) is ignored. In start-end tags,
+    # a lookahead and backreference act as an atomic group, so the many tags
+    # that are not self-closing fail without backtracking.
+    _token = re.compile(
+        r"<(?:!--(?P<comment>.*?)-->"
+        r"|span class=\"pricing\">(?P<price>[^<]*)"
+        rf"|(?P<rawtext>{_RAWTEXT})"
+        r"|(?P<startendtag>[a-zA-Z]"
+        r"(?=(?P<attrs>[^>\"']*(?:(?:\"[^\"]*\"|'[^']*')[^>\"']*)*))"
+        r"(?P=attrs)(?<=/)>)"
+        r"|(?i:/li)\s*>)",
+        re.DOTALL,
+    )
+    _attr = re.compile(
+        r"([^\s\"'/<>=]+)(?:\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s\"'>]+)))?",
+    )
+    # Text and complete markup, so the match ends where incomplete markup starts.
+    _complete = re.compile(
+        r"(?:[^<]+|<(?=[^a-zA-Z/!])"
+        r"|(?P<markup><!--.*?-->"
+        rf"|<{_RAWTEXT}"
+        r"|<(?!!--)[a-zA-Z/!]"
+        r"[^>\"']*(?:(?:\"[^\"]*\"|'[^']*')[^>\"']*)*>))*",
+        re.DOTALL,
+    )
+
+    def __init__(self) -> None:
+        """Initialize parser state."""
+        self.units: List[Dict[str, str]] = []
+        self._unit: Optional[Dict[str, str]] = None
+        self._rawdata = ""
+
+    def feed(self, data: str) -> None:
+        """Parse a chunk of HTML, holding back markup that may be incomplete."""
+        data = self._rawdata + data
+        # The pattern can match nothing, so it always matches.
+        match = cast(Match[str], self._complete.match(data))
+        # Text after the last markup may still be part of a token.
+        end = match.end() if match.group("markup") is None else match.start("markup")
+        self._parse(data[:end])
+        self._rawdata = data[end:]
+
+    def close(self) -> None:
+        """Parse any HTML held back by feed."""
+        self._parse(self._rawdata)
+        self._rawdata = ""
 
     def reset(self) -> None:
         """Erase parser state."""
         self.units = []
         self._unit = None
-        super().reset()
+        self._rawdata = ""
+
+    def _parse(self, data: str) -> None:
+        for match in self._token.finditer(data):
+            comment, price, rawtext, startendtag = match.group(
+                "comment",
+                "price",
+                "rawtext",
+                "startendtag",
+            )
+            if comment is not None:
+                # The start of a listing
+                comment = comment.strip()
+                if comment.startswith("ledgerId"):
+                    ledger, building, unit = comment.split(", ")
+                    self._unit = {
+                        "ledger": ledger.split(" ")[1],
+                        "building": building.split(" ")[1],
+                        "unit": unit.split(" ")[1],
+                    }
+            elif self._unit is None or rawtext is not None:
+                continue
+            elif price is not None:
+                price = html.unescape(price).strip()
+                if price:
+                    self._unit["price"] = price
+            elif startendtag is not None:
+                # The floorplan and description
+                for name, *values in self._attr.findall(startendtag):
+                    name = name.lower()
+                    if name == "src":
+                        self._unit["floorplan"] = html.unescape("".join(values))
+                    if name == "alt":
+                        self._unit["description"] = html.unescape("".join(values))
+            else:
+                # The end of the listing
+                self.units.append(self._unit)
+                self._unit = None
 
 
 class EquityScraper(BaseScraper):
@@ -80,26 +135,36 @@ class EquityScraper(BaseScraper):
             parser = EquityParser()
         parser.reset()
         parser.feed(scrape.text)
-        survey = RentSurvey()
-        for unit in parser.units:
-            # The following fields are not included:
-            # - description
-            # - floorplan
-            # - ledger
-            survey.listings.append(
+        parser.close()
+        return self.units_survey(scrape, parser.units)
+
+    def units_survey(self, scrape: Scrape, units: List[Dict[str, str]]) -> RentSurvey:
+        """Generate a RentSurvey from units parsed from a Scrape."""
+        timestamp = scrape.timestamp
+        url = scrape.url or self.url
+        # The following fields are not included:
+        # - description
+        # - floorplan
+        # - ledger
+        return RentSurvey(
+            listings=[
                 RentListing(
-                    price=float(unit["price"].replace("$", "").replace(",", "")),
+                    price=float(unit["price"].translate(_PRICE_DELETIONS)),
                     scraper=self.name,
-                    timestamp=scrape.timestamp,
+                    timestamp=timestamp,
                     unit=" ".join([unit["building"], unit["unit"]]),
-                    url=scrape.url or self.url,
-                ),
-            )
-        return survey
+                    url=url,
+                )
+                for unit in units
+            ],
+        )
 
     def scrape_survey(self) -> RentSurvey:
-        """Scrape a RentSurvey from an Equity website."""
-        return self.survey(self.scrape(self.url))
+        """Scrape a RentSurvey from an Equity website, parsing it as it arrives."""
+        parser = EquityParser()
+        scrape = self.scrape(self.url, feed=parser.feed)
+        parser.close()
+        return self.units_survey(scrape, parser.units)
 
     @property
     def cache_survey(self) -> RentSurvey:
@@ -107,8 +172,9 @@ class EquityScraper(BaseScraper):
         if self.cache_path is None:
             raise ValueError("cache_path is not set.")
         survey = RentSurvey()
+        parser = EquityParser()
         for scrape in self.cached_scrapes:
-            listings = self.survey(scrape).listings
+            listings = self.survey(scrape, parser).listings
             if not listings:
                 logging.warning("%s is empty.", scrape.path)
             survey.listings.extend(listings)
@@ -2,10 +2,20 @@
 
 import argparse
 import json
+import sys
 from typing import Optional
 
 from searents.equity import EquityParser
 
+try:
+    import orjson
+except ImportError:
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+_PARSER = EquityParser()
+
 
 def cli(
     parser: Optional[argparse.ArgumentParser] = None,
@@ -26,7 +36,14 @@ def main(args: Optional[argparse.Namespace] = None) -> int:
         args = cli().parse_args()
     with open(args.path, "r", encoding="utf-8") as scrape_f:
         html = scrape_f.read()
-    parser = EquityParser()
-    parser.feed(html)
-    print(json.dumps(parser.units, indent=4))
+    _PARSER.reset()
+    _PARSER.feed(html)
+    _PARSER.close()
+    # orjson only supports indenting by 2 spaces and writing UTF-8,
+    # so json does the same.
+    if HAS_ORJSON:
+        output = orjson.dumps(_PARSER.units, option=orjson.OPT_INDENT_2)
+    else:
+        output = json.dumps(_PARSER.units, indent=2, ensure_ascii=False).encode()
+    sys.stdout.buffer.write(output + b"\n")
     return 0
@@ -4,14 +4,13 @@ import datetime
 import logging
 import mimetypes
 import os
-from typing import Any, Iterator, Optional
+from typing import Any, Callable, Iterator, Optional, cast
 
 import attr
-import dateutil.parser
 import requests
 
 
-@attr.s(auto_attribs=True, kw_only=True)
+@attr.s(auto_attribs=True, kw_only=True, slots=True)
 class Scrape:  # pylint: disable=too-few-public-methods
     """Scraped Data and Associated Metadata"""
 
@@ -30,10 +29,16 @@ class BaseScraper:
 
     encoding = "utf-8"
     datetime_format = "%Y%m%dT%H%M%SZ.%f"
+    timeout = 30.0
 
-    def __init__(self, cache_path: Optional[str] = None) -> None:
-        """Initialize cache_path."""
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        """Initialize cache_path and the HTTP session."""
         self.cache_path = cache_path
+        self.session = requests.Session() if session is None else session
 
     @property
     def cache_path(self) -> Optional[str]:
@@ -50,17 +55,43 @@ class BaseScraper:
                 raise NotADirectoryError(path)
         self._cache_path = path  # pylint: disable=attribute-defined-outside-init
 
-    def scrape(self, *args: Any, **kwargs: Any) -> Scrape:
-        """GET a remote resource and save it."""
+    def scrape(
+        self,
+        *args: Any,
+        feed: Optional[Callable[[str], None]] = None,
+        **kwargs: Any,
+    ) -> Scrape:
+        """GET a remote resource and save it, passing its text to feed as it arrives."""
+        kwargs.setdefault("timeout", self.timeout)
         try:
-            response = requests.get(*args, **kwargs)
-        except requests.exceptions.ConnectionError as exc:
-            raise ScrapeError from exc
-        timestamp = datetime.datetime.now(datetime.timezone.utc)
-        try:
-            response.raise_for_status()
-        except requests.exceptions.HTTPError as exc:
+            response = self.session.get(*args, stream=True, **kwargs)
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ) as exc:
             raise ScrapeError from exc
+        with response:
+            timestamp = datetime.datetime.now(datetime.timezone.utc)
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError as exc:
+                raise ScrapeError from exc
+            if response.encoding is None:
+                response.encoding = self.encoding
+            # With an encoding, the body is decoded as it is streamed.
+            stream = cast(
+                Iterator[str],
+                response.iter_content(chunk_size=64 * 1024, decode_unicode=True),
+            )
+            chunks = []
+            try:
+                for chunk in stream:
+                    chunks.append(chunk)
+                    if feed is not None:
+                        feed(chunk)
+            except requests.exceptions.ConnectionError as exc:
+                raise ScrapeError from exc
+        text = "".join(chunks)
         path = None
         if self.cache_path is not None:
             path = os.path.join(
@@ -76,10 +107,10 @@ class BaseScraper:
             )
             logging.info("Caching %s at %s...", response.request.url, path)
             with open(path, "w", encoding=self.encoding) as scrape_f:
-                scrape_f.write(response.text)
+                scrape_f.write(text)
         return Scrape(
-            text=response.text,
-            timestamp=datetime.datetime.now(datetime.timezone.utc),
+            text=text,
+            timestamp=timestamp,
             url=response.request.url,
             path=path,
         )
@@ -89,16 +120,19 @@ class BaseScraper:
         """Load locally cached resources."""
         if self.cache_path is None:
             raise ValueError("cache_path is not set.")
-        for filename in os.listdir(self.cache_path):
-            path = os.path.join(self.cache_path, filename)
-            with open(path, "r", encoding=self.encoding) as scrape_f:
-                text = scrape_f.read()
-            timestamp_str, microsecond_str = os.path.splitext(filename)[0].split(".")
-            yield Scrape(
-                text=text,
-                timestamp=dateutil.parser.parse(timestamp_str).replace(
-                    microsecond=int(microsecond_str),
-                ),
-                url=None,
-                path=path,
-            )
+        with os.scandir(self.cache_path) as entries:
+            for entry in entries:
+                # Decoding the whole file at once is much faster than reading it in
+                # text mode, and keeps newlines as they were scraped.
+                with open(entry.path, "rb") as scrape_f:
+                    text = scrape_f.read().decode(self.encoding)
+                timestamp = datetime.datetime.strptime(
+                    os.path.splitext(entry.name)[0],
+                    self.datetime_format,
+                )
+                yield Scrape(
+                    text=text,
+                    timestamp=timestamp.replace(tzinfo=datetime.timezone.utc),
+                    url=None,
+                    path=entry.path,
+                )
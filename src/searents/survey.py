@@ -1,33 +1,29 @@
 """Structures for Tracking Listings"""
 
 import datetime
-from typing import Any, Iterator, List, Optional, Tuple
+import importlib.util
+from operator import attrgetter
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import attr
 
-try:
-    # https://github.com/matplotlib/matplotlib/issues/20504
-    import matplotlib  # type: ignore
-    from matplotlib import pyplot
+# The visualizer dependencies are slow to import, so they are only imported to plot.
+HAS_VISUALIZER = all(
+    importlib.util.find_spec(name) is not None for name in ["matplotlib", "numpy"]
+)
 
-    # https://github.com/matplotlib/matplotlib/issues/20504
-    from matplotlib.pyplot import cm  # type: ignore
-    import numpy
-except ImportError:
-    HAS_VISUALIZER = False
-else:
-    HAS_VISUALIZER = True
 
-
-@attr.s(auto_attribs=True, kw_only=True)
+@attr.s(auto_attribs=True, kw_only=True, slots=True)
 class RentListing:  # pylint: disable=too-few-public-methods
     """Information about a Rental Listing"""
 
+    # The few distinct names, units, and urls are shared by many listings.
     price: float
-    scraper: str
+    scraper: str = attr.ib(converter=sys.intern)
     timestamp: datetime.datetime
-    unit: str
-    url: str
+    unit: str = attr.ib(converter=sys.intern)
+    url: str = attr.ib(converter=sys.intern)
 
 
 class RentSurvey:
@@ -43,27 +39,50 @@ class RentSurvey:
     def __str__(self) -> str:
         """String-ify collected listings."""
         return "\n".join(
-            " ".join(
-                [
-                    f"[{listing.timestamp}]",
-                    f"${listing.price:,.2f}",
-                    listing.scraper,
-                    listing.unit,
-                ],
-            )
+            f"[{listing.timestamp}] ${listing.price:,.2f}"
+            f" {listing.scraper} {listing.unit}"
             for listing in self.listings
         )
 
     def __eq__(self, other: Any) -> bool:
         """Instances are equal if they have the same listings in any order."""
-
-        def _key(listing: RentListing) -> datetime.datetime:
-            return listing.timestamp
-
+        key = attrgetter("timestamp")
         return isinstance(other, RentSurvey) and (
-            sorted(self.listings, key=_key) == sorted(other.listings, key=_key)
+            sorted(self.listings, key=key) == sorted(other.listings, key=key)
         )
 
+    def _groups(self) -> Dict[str, Dict[str, Episode]]:
+        """Group listings by url and then by unit in a single pass."""
+        groups: Dict[str, Dict[str, RentSurvey.Episode]] = {}
+        for listing in self.listings:
+            groups.setdefault(listing.url, {}).setdefault(listing.unit, []).append(
+                listing,
+            )
+        return groups
+
+    @staticmethod
+    def _split(
+        listings: Episode,
+        threshold: Optional[datetime.timedelta] = None,
+    ) -> Episodes:
+        """Split one unit's listings into episodes at gaps over the threshold."""
+        if threshold is None:
+            threshold = datetime.timedelta(weeks=1)
+        listings.sort(key=attrgetter("timestamp"))
+        timestamps = [listing.timestamp for listing in listings]
+        gaps = [
+            i
+            for i, (previous, current) in enumerate(
+                zip(timestamps, timestamps[1:]),
+                start=1,
+            )
+            if current - previous > threshold
+        ]
+        return [
+            listings[start:stop]
+            for start, stop in zip([0] + gaps, gaps + [len(listings)])
+        ]
+
     def episodes(
         self,
         threshold: Optional[datetime.timedelta] = None,
@@ -74,106 +93,92 @@ class RentSurvey:
         Related listings share url (==), unit (==), and
         timestamp (within a threshold of the previous listing).
         """
-        if threshold is None:
-            threshold = datetime.timedelta(weeks=1)
-        for url in {listing.url for listing in self.listings}:
-            url_listings = [listing for listing in self.listings if listing.url == url]
-            for unit in sorted({listing.unit for listing in url_listings}):
-                unit_listings = sorted(
-                    (listing for listing in url_listings if listing.unit == unit),
-                    key=lambda listing: listing.timestamp,
-                )
-                episode = [unit_listings[0]]
-                for listing in unit_listings[1:]:
-                    if listing.timestamp - episode[-1].timestamp > threshold:
-                        yield episode
-                        episode = []
-                    episode.append(listing)
-                yield episode
+        for units in self._groups().values():
+            for unit in sorted(units):
+                yield from self._split(units[unit], threshold)
 
     def unit_episodes(
         self,
-        *args: Any,
-        **kwargs: Any,
+        threshold: Optional[datetime.timedelta] = None,
     ) -> Iterator[Tuple[str, Episodes]]:
         """Generate tuples consisting of a unit and its episodes, respectively."""
-        iterator = iter(self.episodes(*args, **kwargs))
-        try:
-            episodes = [next(iterator)]
-        except StopIteration as exc:
-            raise RuntimeError("This should never happen.") from exc
-        unit = episodes[-1][-1].unit
-        for episode in iterator:
-            if episode[-1].unit != unit:
-                yield unit, episodes
-                unit, episodes = episode[-1].unit, []
-            episodes.append(episode)
-        yield unit, episodes
+        for units in self._groups().values():
+            for unit in sorted(units):
+                yield unit, self._split(units[unit], threshold)
 
     def url_episodes(
         self,
-        *args: Any,
-        **kwargs: Any,
+        threshold: Optional[datetime.timedelta] = None,
     ) -> Iterator[Tuple[str, List[Tuple[str, Episodes]]]]:
         """
         Generate (url, unit_episodes) tuples.
 
         unit_episodes is a list of units and their episodes, respectively.
         """
-        iterator = iter(self.unit_episodes(*args, **kwargs))
-        try:
-            unit_episodes = [next(iterator)]
-        except StopIteration as exc:
-            raise RuntimeError("This should never happen.") from exc
-        url = unit_episodes[-1][-1][-1][-1].url
-        for unit, episodes in iterator:
-            if episodes[-1][-1].url != url:
-                yield url, unit_episodes
-                url, unit_episodes = episodes[-1][-1].url, []
-            unit_episodes.append((unit, episodes))
-        yield url, unit_episodes
-
-    def visualize(self, name: Optional[str] = None) -> None:
+        for url, units in self._groups().items():
+            yield url, [
+                (unit, self._split(units[unit], threshold)) for unit in sorted(units)
+            ]
+
+    def visualize(  # pylint: disable=too-many-locals
+        self,
+        name: Optional[str] = None,
+    ) -> None:
         """Plot listings."""
         if not HAS_VISUALIZER:
             raise RuntimeError("The visualizer dependencies are not installed.")
         if not self.listings:
             return
-        urls = {listing.url for listing in self.listings}
-        distinct_units = len(
-            {listing.url + listing.unit for listing in self.listings},
-        )
-        url_colors = iter(
-            cm.rainbow(numpy.linspace(0, 1, len(urls))),  # pylint: disable=no-member
-        )
-        unit_colors = iter(
-            cm.rainbow(  # pylint: disable=no-member
-                numpy.linspace(0, 1, distinct_units),
+        # pylint: disable=import-outside-toplevel
+        # https://github.com/matplotlib/matplotlib/issues/20504
+        import matplotlib  # type: ignore
+        from matplotlib import pyplot
+
+        from matplotlib.collections import LineCollection
+        from matplotlib.lines import Line2D
+
+        # https://github.com/matplotlib/matplotlib/issues/20504
+        from matplotlib.pyplot import cm  # type: ignore
+        import numpy
+
+        url_episodes = list(self.url_episodes())
+        multiple_urls = len(url_episodes) > 1
+        # Episodes are colored by url when there are several, and by unit otherwise.
+        colors = cm.rainbow(  # pylint: disable=no-member
+            numpy.linspace(
+                0,
+                1,
+                len(url_episodes) if multiple_urls else len(url_episodes[0][1]),
             ),
         )
-        labelled = set()
-        for _, unit_episodes in self.url_episodes():
-            url_color = next(url_colors)
-            for unit, episodes in unit_episodes:
-                unit_color = next(unit_colors)
+        date2num = matplotlib.dates.date2num
+        text = pyplot.text
+        segments = []
+        segment_colors = []
+        handles: Dict[str, Any] = {}
+        for url_index, (_, unit_episodes) in enumerate(url_episodes):
+            for unit_index, (unit, episodes) in enumerate(unit_episodes):
+                color = colors[url_index if multiple_urls else unit_index]
                 for episode in episodes:
-                    label = episode[-1].scraper if len(urls) > 1 else unit
-                    pyplot.plot_date(
-                        matplotlib.dates.date2num(
-                            [listing.timestamp for listing in episode],
-                        ),
-                        [listing.price for listing in episode],
-                        "b-",
-                        color=url_color if len(urls) > 1 else unit_color,
-                        label=label if label not in labelled else "",
-                        linewidth=2,
-                    )
-                    labelled.add(label)
-                    pyplot.text(
-                        matplotlib.dates.date2num([episode[-1].timestamp]),
-                        episode[-1].price,
-                        "{0} ({1})".format(unit, episode[-1].price),
-                    )
+                    dates = date2num([listing.timestamp for listing in episode])
+                    prices = [listing.price for listing in episode]
+                    segments.append(numpy.column_stack([dates, prices]))
+                    segment_colors.append(color)
+                    if multiple_urls and episode[-1].scraper not in handles:
+                        handles[episode[-1].scraper] = Line2D(
+                            [],
+                            [],
+                            color=color,
+                            linewidth=2,
+                        )
+                    text(dates[-1], prices[-1], f"{unit} ({episode[-1].price})")
+        # Every episode is drawn by one collection rather than a line apiece.
+        axes = pyplot.gca()
+        axes.add_collection(
+            LineCollection(segments, colors=segment_colors, linewidths=2),
+        )
+        axes.xaxis_date()
+        axes.autoscale_view()
         if name is not None:
             pyplot.gcf().canvas.set_window_title(name)
         pyplot.title("Apartment Prices Over Time")
@@ -182,6 +187,10 @@ class RentSurvey:
         pyplot.grid(b=True, which="major", color="k", linestyle="-")
         pyplot.grid(b=True, which="minor", color="k", linestyle=":")
         pyplot.minorticks_on()
-        if len(urls) > 1:
-            pyplot.legend(loc="upper left")
+        if multiple_urls:
+            pyplot.legend(
+                handles=list(handles.values()),
+                labels=list(handles),
+                loc="upper left",
+            )
         pyplot.show()
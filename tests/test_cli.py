@@ -0,0 +1,198 @@
+"""Tests for searents.cli."""
+
+
+import argparse
+import datetime
+import pickle
+import time
+from pathlib import Path
+
+import attr
+import pytest
+
+import searents.cli
+from searents.equity import EquityScraper
+from searents.survey import RentListing, RentSurvey
+
+
+def _connection(listings):
+    connection = searents.cli.database_connection(":memory:")
+    connection.executemany(
+        "INSERT INTO listings VALUES (?, ?, ?, ?, ?)",
+        [
+            (
+                listing.timestamp,
+                listing.url,
+                listing.scraper,
+                listing.unit,
+                listing.price,
+            )
+            for listing in listings
+        ],
+    )
+    connection.commit()
+    return connection
+
+
+LISTINGS = [
+    RentListing(
+        price=price,
+        scraper=scraper,
+        timestamp=datetime.datetime(2021, 6, day, tzinfo=datetime.timezone.utc),
+        unit=unit,
+        url=f"https://example.com/{scraper}",
+    )
+    for scraper, unit, price, day in [
+        ("A", "1 101", 1500.0, 1),
+        ("A", "1 102", 2500.0, 2),
+        ("B", "1 101", 3500.0, 3),
+    ]
+]
+
+
+def _show(capsys, filter_key=".*", filter_=".*", names=("A", "B")):
+    searents.cli.show_handler(
+        argparse.Namespace(
+            database=":memory:",
+            filter=filter_,
+            filter_key=filter_key,
+            graphical=False,
+        ),
+        [EquityScraper(name=name, url="https://example.com") for name in names],
+        _connection(LISTINGS),
+    )
+    return capsys.readouterr().out.splitlines()
+
+
+def test_show(capsys):
+    """Verify that show prints every listing of the selected scrapers."""
+    assert len(_show(capsys)) == 3
+    assert len(_show(capsys, names=["A"])) == 2
+    assert [line.split()[3] for line in _show(capsys, names=["B", "A"])] == [
+        "B",
+        "A",
+        "A",
+    ]
+
+
+def test_show_filter(capsys):
+    """Verify that show only prints listings with a matching key and value."""
+    assert [line.split()[-1] for line in _show(capsys, "unit", "102")] == ["102"]
+    assert len(_show(capsys, "unit", "101")) == 2
+    assert len(_show(capsys, ".*", "2,?500")) == 1
+    assert len(_show(capsys, "price", "101")) == 0
+    assert len(_show(capsys, "timestamp", "2021-06-0[12]")) == 2
+    assert _show(capsys, "nonexistent") == []
+
+
+def test_load_cache_survey(tmp_path, monkeypatch):
+    """Verify that cache surveys are saved and reused until the cache changes."""
+    html = Path(__file__).with_name("urbana.html").read_text()
+    scraper = EquityScraper(
+        name="Urbana",
+        url="https://example.com",
+        cache_path=str(tmp_path / "Urbana"),
+    )
+    (tmp_path / "Urbana" / "20210601T120000Z.000000.html").write_text(html)
+    survey = searents.cli.load_cache_survey(scraper)
+    assert len(survey.listings) == 15
+    assert (tmp_path / "Urbana.survey.pickle").exists()
+
+    monkeypatch.setattr(EquityScraper, "cache_survey", None)
+    assert searents.cli.load_cache_survey(scraper) == survey
+    monkeypatch.undo()
+
+    (tmp_path / "Urbana" / "20210602T120000Z.000000.html").write_text(html)
+    assert len(searents.cli.load_cache_survey(scraper).listings) == 30
+
+    (tmp_path / "Urbana.survey.pickle").write_bytes(pickle.dumps((1, 2, 3)))
+    assert len(searents.cli.load_cache_survey(scraper).listings) == 30
+
+
+def test_insert_listings():
+    """Verify that rows are inserted in order across full and partial batches."""
+    connection = _connection([])
+    rows = [
+        (LISTINGS[0].timestamp, LISTINGS[0].url, "A", str(unit), 1000.0)
+        for unit in range(250)
+    ]
+    searents.cli.insert_listings(connection, iter(rows), batch_size=100)
+    assert [row["unit"] for row in connection.execute("SELECT unit FROM listings")] == [
+        str(unit) for unit in range(250)
+    ]
+
+
+@attr.s(auto_attribs=True)
+class _Scraper:
+    name: str
+    survey: RentSurvey
+    scraped: list
+
+    def scrape_survey(self):
+        self.scraped.append(self.name)
+        if not self.survey.listings:
+            raise KeyError("price")
+        time.sleep(0.1)
+        return self.survey
+
+
+def test_fetch_failure(tmp_path, capsys):
+    """Verify that fetching stops at an unexpected error but keeps what it got."""
+    database = str(tmp_path / "searents.db")
+    connection = searents.cli.database_connection(database)
+    scraped = []
+    scrapers = [
+        _Scraper(name, RentSurvey(listings=LISTINGS[:2]), scraped)
+        for name in ["A", "B", "C", "D", "E", "F"]
+    ]
+    scrapers[1].survey = RentSurvey()
+    with pytest.raises(KeyError):
+        searents.cli.fetch_handler(
+            argparse.Namespace(database=database, jobs=2),
+            scrapers,
+            connection,
+        )
+    assert "F" not in scraped
+    connection.close()
+    connection = searents.cli.database_connection(database)
+    assert sorted(
+        row["scraper"]
+        for row in connection.execute("SELECT DISTINCT scraper FROM listings")
+    ) == sorted(name for name in scraped if name != "B")
+    assert len(capsys.readouterr().out.splitlines()) == 2 * (len(scraped) - 1)
+
+
+def test_database_matches():
+    """Verify that the database is compared against a survey per scraper."""
+    connection = _connection(LISTINGS)
+    assert searents.cli.database_matches(
+        connection,
+        "A",
+        RentSurvey(listings=LISTINGS[1::-1]),
+    )
+    assert not searents.cli.database_matches(
+        connection,
+        "A",
+        RentSurvey(listings=LISTINGS[:1]),
+    )
+    assert not searents.cli.database_matches(
+        connection,
+        "A",
+        RentSurvey(listings=[LISTINGS[0], attr.evolve(LISTINGS[1], price=1.0)]),
+    )
+
+
+def test_timestamp_converter():
+    """Verify that timestamps are read back whether or not they are ISO 8601."""
+    connection = _connection(LISTINGS[:1])
+    connection.execute(
+        "INSERT INTO listings VALUES (?, ?, ?, ?, ?)",
+        ("Jun 1 2021 12:00 UTC", "https://example.com/B", "B", "1 101", 1.0),
+    )
+    timestamps = [
+        row["timestamp"] for row in connection.execute("SELECT * FROM listings")
+    ]
+    assert timestamps == [
+        LISTINGS[0].timestamp,
+        datetime.datetime(2021, 6, 1, 12, tzinfo=datetime.timezone.utc),
+    ]
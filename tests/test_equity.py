@@ -1,8 +1,11 @@
 """Tests for searents.equity."""
 
 
+import io
 from pathlib import Path
 
+import requests
+
 import searents.equity
 
 
@@ -148,3 +151,116 @@ def test_equity_parser():
             "unit": "331",
         },
     ]
+
+
+def test_equity_parser_chunks():
+    """Verify that the EquityParser gives the same units when fed in chunks."""
+    html = Path(__file__).with_name("urbana.html").read_text()
+    parser = searents.equity.EquityParser()
+    parser.feed(html)
+    parser.close()
+    units = parser.units
+    parser.reset()
+    for start in range(0, len(html), 1000):
+        parser.feed(html[start : start + 1000])
+    parser.close()
+    assert parser.units == units
+
+
+def test_equity_parser_markup():
+    """Verify that the EquityParser handles uppercase and quoted markup."""
+    parser = searents.equity.EquityParser()
+    parser.feed(
+        "<LI><!-- ledgerId: 1, buildingId: 2, unitId: 303 -->"
+        '<IMG SRC="https://example.com/fp" ALT="a > b" />'
+        '<span class="pricing">$1,500</span></LI>',
+    )
+    parser.close()
+    assert parser.units == [
+        {
+            "building": "2",
+            "description": "a > b",
+            "floorplan": "https://example.com/fp",
+            "ledger": "1",
+            "price": "$1,500",
+            "unit": "303",
+        },
+    ]
+
+
+def test_equity_parser_split():
+    """Verify that the EquityParser handles a quoted < split at any offset."""
+    html = (
+        "<li><!-- ledgerId: 1, buildingId: 2, unitId: 303 -->"
+        '<img alt="a < b" src="https://example.com/fp" />'
+        '<span class="pricing">$1,500</span></li>'
+    )
+    parser = searents.equity.EquityParser()
+    for offset in range(len(html) + 1):
+        parser.reset()
+        parser.feed(html[:offset])
+        parser.feed(html[offset:])
+        parser.close()
+        assert parser.units == [
+            {
+                "building": "2",
+                "description": "a < b",
+                "floorplan": "https://example.com/fp",
+                "ledger": "1",
+                "price": "$1,500",
+                "unit": "303",
+            },
+        ]
+
+
+def test_equity_parser_script():
+    """Verify that the EquityParser ignores markup in scripts and styles."""
+    html = (
+        "<li><!-- ledgerId: 1, buildingId: 2, unitId: 303 -->"
+        "<SCRIPT>var item = '<li>' + name + '</li>';</SCRIPT >"
+        "<style>li::after { content: '</li>'; }</style>"
+        '<span class="pricing">$1,500</span></li>'
+    )
+    parser = searents.equity.EquityParser()
+    for offset in range(len(html) + 1):
+        parser.reset()
+        parser.feed(html[:offset])
+        parser.feed(html[offset:])
+        parser.close()
+        assert parser.units == [
+            {"building": "2", "ledger": "1", "price": "$1,500", "unit": "303"},
+        ]
+
+
+class _Session:
+    """Respond to every GET with a page from the test directory."""
+
+    def __init__(self, name):
+        self.content = Path(__file__).with_name(name).read_bytes()
+
+    def get(self, url, **_):
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["content-type"] = "text/html"
+        response.raw = io.BytesIO(self.content)
+        response.request = requests.Request("GET", url).prepare()
+        return response
+
+
+def test_scrape_survey(tmp_path):
+    """Verify that a streamed scrape is parsed and cached like the cached copy."""
+    scraper = searents.equity.EquityScraper(
+        name="Urbana",
+        url="https://example.com/urbana",
+        session=_Session("urbana.html"),
+        cache_path=str(tmp_path / "Urbana"),
+    )
+    survey = scraper.scrape_survey()
+    assert len(survey.listings) == 15
+    assert [
+        (listing.timestamp, listing.unit, listing.price, listing.url)
+        for listing in survey.listings
+    ] == [
+        (listing.timestamp, listing.unit, listing.price, "https://example.com/urbana")
+        for listing in scraper.cache_survey.listings
+    ]
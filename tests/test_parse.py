@@ -0,0 +1,42 @@
+"""Tests for searents.parse."""
+
+
+import argparse
+
+import pytest
+
+import searents.parse
+
+HTML = """
+<li>
+<!-- ledgerId: 1, buildingId: 2, unitId: 303 -->
+<img src="https://example.com/fp" alt="Café — view" />
+<span class="pricing">$1,500</span>
+</li>
+"""
+
+
+@pytest.mark.parametrize("has_orjson", [False, True])
+def test_parse(tmp_path, capsysbinary, monkeypatch, has_orjson):
+    """Verify that json and orjson print the same UTF-8 output."""
+    if has_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(searents.parse, "HAS_ORJSON", has_orjson)
+    path = tmp_path / "scrape.html"
+    path.write_text(HTML, encoding="utf-8")
+    assert searents.parse.main(argparse.Namespace(path=str(path))) == 0
+    assert (
+        capsysbinary.readouterr().out
+        == (
+            "[\n"
+            "  {\n"
+            '    "ledger": "1",\n'
+            '    "building": "2",\n'
+            '    "unit": "303",\n'
+            '    "floorplan": "https://example.com/fp",\n'
+            '    "description": "Café — view",\n'
+            '    "price": "$1,500"\n'
+            "  }\n"
+            "]\n"
+        ).encode()
+    )
@@ -0,0 +1,80 @@
+"""Tests for searents.survey."""
+
+
+import datetime
+
+from searents.survey import RentListing, RentSurvey
+
+
+def _listing(url, unit, day, price=1000.0):
+    return RentListing(
+        price=price,
+        scraper=url.upper(),
+        timestamp=datetime.datetime(2021, 6, 1, tzinfo=datetime.timezone.utc)
+        + datetime.timedelta(days=day),
+        unit=unit,
+        url=url,
+    )
+
+
+def test_episodes():
+    """Verify that listings are split into episodes at gaps over the threshold."""
+    survey = RentSurvey(
+        listings=[
+            _listing("a", "1 101", 11),
+            _listing("a", "1 101", 0),
+            _listing("a", "1 101", 3),
+            _listing("a", "1 101", 20),
+            _listing("a", "1 102", 1),
+        ],
+    )
+    assert [
+        [listing.timestamp.day for listing in episode] for episode in survey.episodes()
+    ] == [[1, 4], [12], [21], [2]]
+    assert [
+        [listing.timestamp.day for listing in episode]
+        for episode in survey.episodes(datetime.timedelta(days=30))
+    ] == [[1, 4, 12, 21], [2]]
+
+
+def test_url_episodes():
+    """Verify that episodes are grouped by url and then by unit."""
+    survey = RentSurvey(
+        listings=[
+            _listing("a", "1 101", 0),
+            _listing("b", "2 201", 0),
+            _listing("a", "1 102", 0),
+            _listing("a", "1 101", 10),
+        ],
+    )
+    assert sorted(
+        (url, [(unit, len(episodes)) for unit, episodes in unit_episodes])
+        for url, unit_episodes in survey.url_episodes()
+    ) == [
+        ("a", [("1 101", 2), ("1 102", 1)]),
+        ("b", [("2 201", 1)]),
+    ]
+
+
+def test_eq():
+    """Verify that surveys are equal regardless of listing order."""
+    listings = [_listing("a", "1 101", day) for day in range(3)]
+    assert RentSurvey(listings=listings) == RentSurvey(listings=listings[::-1])
+    assert RentSurvey(listings=listings) != RentSurvey(listings=listings[1:])
+
+
+def test_url_episodes_shared_unit():
+    """Verify that units with the same name at different urls are kept apart."""
+    survey = RentSurvey(
+        listings=[
+            _listing("a", "1 101", 0),
+            _listing("b", "1 101", 1),
+            _listing("a", "1 101", 2),
+        ],
+    )
+    assert [
+        (url, [(unit, len(episodes)) for unit, episodes in unit_episodes])
+        for url, unit_episodes in survey.url_episodes()
+    ] == [("a", [("1 101", 1)]), ("b", [("1 101", 1)])]
+    assert [unit for unit, _ in survey.unit_episodes()] == ["1 101", "1 101"]
+    assert list(RentSurvey().url_episodes()) == []